@@ -7,23 +7,162 @@ import os
 import sys
 from pathlib import Path
 import shutil
+import tempfile
+import threading
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 # Import our PDF converter class
 try:
-    from pdf_converter import PDFConverter
+    from pdf_converter_cli import PDFConverter
 except ImportError:
-    print("Error: pdf_converter module not found. Make sure pdf_converter.py is in the same directory.")
+    print("Error: pdf_converter_cli module not found. Make sure pdf_converter_cli.py is in the same directory.")
     sys.exit(1)
 
-def demo_conversion(maintain_structure=True):
-    """Demo function showing programmatic use of the PDF converter
+# Directories that never contain files worth converting
+SKIP_DIRS = {'__pycache__', 'node_modules'}
+
+def _iter_files(root, exclude=None):
+    """Yield a DirEntry for every file under root using os.scandir
     
-    Args:
-        maintain_structure (bool): If True, maintains directory structure. 
-                                 If False, creates flat list of PDFs.
+    Reuses the cached entry type from the directory listing instead of
+    issuing an extra stat per file like os.walk + Path(root) / file does.
+    Hidden directories (including old output still being deleted), SKIP_DIRS
+    and the exclude directory (the PDF output folder) are not descended into.
+    Folders that can't be listed are skipped, as os.walk skips them.
+    """
+    exclude = os.fspath(exclude) if exclude is not None else None
+    stack = [os.fspath(root)]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        name = entry.name
+                        if not (name.startswith('.') or name in SKIP_DIRS or entry.path == exclude):
+                            stack.append(entry.path)
+                    elif entry.is_file():
+                        yield entry
+        except OSError:
+            continue
+
+def _discard_dir(path):
+    """Remove a directory without blocking on the delete
+    
+    The directory is renamed into a hidden trash folder next to it (a single
+    rename syscall) and the trash is deleted on a background thread.
+    """
+    if not path.exists():
+        return
+    
+    trash = tempfile.mkdtemp(prefix=f".{path.name}.trash.", dir=path.parent)
+    os.rename(path, os.path.join(trash, path.name))
+    threading.Thread(target=shutil.rmtree, args=(trash,), kwargs={'ignore_errors': True}).start()
+
+def _discover(converter, test_dir, pdf_dir):
+    """Return every supported file under test_dir, skipping the pdf_dir output"""
+    # Classification only depends on the extension, so test it against a
+    # precomputed set instead of calling get_file_type
+    supported_exts = frozenset(
+        ext for exts in converter.supported_formats.values() for ext in exts
+    )
+    supported_files = []
+    for entry in _iter_files(test_dir, exclude=pdf_dir):
+        if os.path.splitext(entry.name)[1].lower() in supported_exts:
+            supported_files.append(entry.path)
+    return supported_files
+
+def generate_unique_filename(output_dir, base_name, used_names, name_counts, extension=".pdf"):
+    """Generate a unique filename in output_dir (flat or per structured folder)
+    
+    Uniqueness is checked against the in-memory set of names already used in
+    output_dir instead of stat'ing candidate paths on disk. name_counts
+    remembers the next suffix for each base name, so repeated names (many
+    README files, say) get _1, _2, ... without re-probing earlier suffixes.
+    """
+    counter = name_counts[base_name]
+    name = f"{base_name}{extension}" if counter == 0 else f"{base_name}_{counter}{extension}"
+    
+    while name in used_names:
+        counter += 1
+        name = f"{base_name}_{counter}{extension}"
+    
+    name_counts[base_name] = counter + 1
+    used_names.add(name)
+    return os.path.join(output_dir, name)
+
+def _split_paths(supported_files, test_dir):
+    """Split every file path into the parts needed to plan its output
+    
+    Yields:
+        tuple: (file_path, relative_path, parent_rel, parent_name, stem)
+    """
+    root_len = len(os.fspath(test_dir)) + 1
+    for file_path in supported_files:
+        relative_path = file_path[root_len:]
+        parent_rel, file_name = os.path.split(relative_path)
+        parent_name = parent_rel.replace('/', '_').replace('\\', '_')
+        yield file_path, relative_path, parent_rel, parent_name, os.path.splitext(file_name)[0]
+
+def _plan_structured(plans, pdf_dir):
+    """Plan output paths that mirror the source directory structure
+    
+    Runs on the submitting thread so each directory exists before its files
+    are converted in parallel. Paths stay plain strings since the converter
+    API takes strings anyway. Files whose output cannot be prepared are
+    reported and skipped. Sources that differ only in extension would share
+    a PDF, so repeated names in a folder get _1, _2, ... suffixes.
+    
+    Yields:
+        tuple: (file_path, relative_path, output_path, success label, listing label)
+    """
+    made_dirs = set()
+    planned_names = {}
+    pdf_dir_str = os.fspath(pdf_dir)
+    
+    for file_path, relative_path, parent_rel, parent_name, stem in plans:
+        output_subdir = os.path.join(pdf_dir_str, parent_rel) if parent_rel else pdf_dir_str
+        if output_subdir not in made_dirs:
+            try:
+                os.makedirs(output_subdir, exist_ok=True)
+            except OSError as e:
+                print(f"❌ Error creating {output_subdir}: {str(e)}")
+                continue
+            made_dirs.add(output_subdir)
+        used_names, name_counts = planned_names.setdefault(output_subdir, (set(), Counter()))
+        output_path = generate_unique_filename(output_subdir, stem, used_names, name_counts)
+        output_name = os.path.basename(output_path)
+        listing = os.path.join(parent_rel, output_name) if parent_rel else output_name
+        
+        yield file_path, relative_path, output_path, output_path, listing
+
+def _plan_flat(plans, pdf_dir):
+    """Plan output paths with all PDFs in the root pdf directory
+    
+    Runs on the submitting thread so unique-name generation is race-free
+    while conversions run in parallel.
+    
+    Yields:
+        tuple: (file_path, relative_path, output_path, success label, listing label)
     """
+    pdf_dir_str = os.fspath(pdf_dir)
+    with os.scandir(pdf_dir) as it:
+        used_names = {entry.name for entry in it}
+    name_counts = Counter()
+    
+    for file_path, relative_path, parent_rel, parent_name, stem in plans:
+        # If file is in subdirectory, include parent directory name to make it unique
+        base_name = f"{parent_name}_{stem}" if parent_name else stem
+        output_path = generate_unique_filename(pdf_dir_str, base_name, used_names, name_counts)
+        output_name = os.path.basename(output_path)
+        yield file_path, relative_path, output_path, output_name, output_name
+
+def _prepare(structure_mode, supported_files):
+    """Print the demo header, reset the output directory and find the files
     
-    structure_mode = "directory structure" if maintain_structure else "flat list"
+    Returns:
+        tuple: (converter, test_dir, pdf_dir, supported_files)
+    """
     print(f"🔄 PDF Converter Demo - {structure_mode.title()}")
     print("=" * 50)
     
@@ -35,8 +174,7 @@ def demo_conversion(maintain_structure=True):
     pdf_dir = test_dir / "pdf"
     
     # Clear and recreate PDF output directory for clean demo
-    if pdf_dir.exists():
-        shutil.rmtree(pdf_dir)
+    _discard_dir(pdf_dir)
     pdf_dir.mkdir(exist_ok=True)
     
     print(f"📁 Processing files in: {test_dir}")
@@ -45,74 +183,46 @@ def demo_conversion(maintain_structure=True):
     print()
     
     # Get all supported files
-    supported_files = []
-    for root, dirs, files in os.walk(test_dir):
-        for file in files:
-            file_path = Path(root) / file
-            if converter.get_file_type(file_path):
-                supported_files.append(file_path)
+    if supported_files is None:
+        supported_files = _discover(converter, test_dir, pdf_dir)
     
     if not supported_files:
         print("❌ No supported files found in test_files directory")
-        return
-    
-    print(f"📋 Found {len(supported_files)} files to convert:")
-    for file_path in supported_files:
-        print(f"   • {file_path}")
-    print()
+    else:
+        print(f"📋 Found {len(supported_files)} files to convert:")
+        sys.stdout.write("".join(f"   • {file_path}\n" for file_path in supported_files))
+        print()
     
-    # Helper function to generate unique filename for flat structure
-    def generate_unique_filename(output_dir, base_name, extension=".pdf"):
-        output_path = output_dir / f"{base_name}{extension}"
-        counter = 1
-        
-        while output_path.exists():
-            output_path = output_dir / f"{base_name}_{counter}{extension}"
-            counter += 1
-        
-        return output_path
+    return converter, test_dir, pdf_dir, supported_files
+
+def _run_conversions(converter, tasks, total, pdf_dir, structure_mode, max_workers):
+    """Convert the planned files in parallel and print the summary
     
-    # Convert each file
+    tasks may be a generator: each file is submitted as soon as it has been
+    planned, so conversions start while the rest are still being planned.
+    Files that could not be planned count as failed.
+    """
     successful = 0
-    failed = 0
+    generated = []
     
-    for file_path in supported_files:
-        try:
-            # Create relative path structure
-            relative_path = file_path.relative_to(test_dir)
-            pdf_filename = relative_path.stem + ".pdf"
-            
-            if maintain_structure:
-                # Maintain directory structure
-                output_subdir = pdf_dir / relative_path.parent
-                output_subdir.mkdir(parents=True, exist_ok=True)
-                output_path = output_subdir / pdf_filename
-            else:
-                # Flat structure - all files in root pdf directory
-                base_name = relative_path.stem
-                # If file is in subdirectory, include parent directory name to make it unique
-                if relative_path.parent != Path('.'):
-                    parent_name = str(relative_path.parent).replace('/', '_').replace('\\', '_')
-                    base_name = f"{parent_name}_{base_name}"
-                
-                output_path = generate_unique_filename(pdf_dir, base_name)
-            
-            print(f"🔄 Converting: {relative_path}")
+    with ThreadPoolExecutor(max_workers=max_workers or os.cpu_count()) as executor:
+        futures = {
+            executor.submit(converter.convert_file, file_path, output_path): (relative_path, label, listing)
+            for file_path, relative_path, output_path, label, listing in tasks
+        }
+        failed = total - len(futures)
+        
+        # convert_file reports failures through its bool return value
+        for future in as_completed(futures):
+            relative_path, label, listing = futures[future]
             
-            # Convert the file
-            if converter.convert_file(str(file_path), str(output_path)):
+            if future.result():
                 successful += 1
-                if maintain_structure:
-                    print(f"   ✅ Success → {output_path}")
-                else:
-                    print(f"   ✅ Success → {output_path.name}")
+                generated.append(listing)
+                print(f"🔄 Converted: {relative_path}\n   ✅ Success → {label}")
             else:
                 failed += 1
-                print(f"   ❌ Failed")
-                
-        except Exception as e:
-            failed += 1
-            print(f"   ❌ Error: {str(e)}")
+                print(f"❌ Failed: {relative_path}")
     
     print()
     print("📊 Conversion Summary:")
@@ -121,31 +231,62 @@ def demo_conversion(maintain_structure=True):
     print(f"   📁 PDFs saved in: {pdf_dir}")
     print(f"   🏗️  Structure: {structure_mode}")
     
-    # List generated PDFs
-    pdf_files = list(pdf_dir.rglob("*.pdf"))
-    if pdf_files:
+    # List generated PDFs - already known from the conversion results,
+    # so there is no need to walk the output directory again
+    if generated:
         print()
         print("📄 Generated PDF files:")
-        for pdf_file in pdf_files:
-            if maintain_structure:
-                rel_path = pdf_file.relative_to(pdf_dir)
-                print(f"   • {rel_path}")
-            else:
-                print(f"   • {pdf_file.name}")
+        sys.stdout.write("".join(f"   • {listing}\n" for listing in generated))
+
+def demo_conversion_structured(max_workers=None, supported_files=None):
+    """Demo conversion that maintains the directory structure"""
+    structure_mode = "directory structure"
+    converter, test_dir, pdf_dir, supported_files = _prepare(structure_mode, supported_files)
+    if supported_files:
+        tasks = _plan_structured(_split_paths(supported_files, test_dir), pdf_dir)
+        _run_conversions(converter, tasks, len(supported_files), pdf_dir, structure_mode, max_workers)
+    return supported_files
+
+def demo_conversion_flat(max_workers=None, supported_files=None):
+    """Demo conversion that creates a flat list of PDFs"""
+    structure_mode = "flat list"
+    converter, test_dir, pdf_dir, supported_files = _prepare(structure_mode, supported_files)
+    if supported_files:
+        tasks = _plan_flat(_split_paths(supported_files, test_dir), pdf_dir)
+        _run_conversions(converter, tasks, len(supported_files), pdf_dir, structure_mode, max_workers)
+    return supported_files
+
+def demo_conversion(maintain_structure=True, max_workers=None, supported_files=None):
+    """Demo function showing programmatic use of the PDF converter
+    
+    Args:
+        maintain_structure (bool): If True, maintains directory structure. 
+                                 If False, creates flat list of PDFs.
+        max_workers (int): Number of parallel conversions (default: CPU count).
+        supported_files (list): Files found by a previous run. When omitted
+                                the test directory is scanned.
+    
+    Returns:
+        list: The supported files that were converted, for reuse by later runs
+    """
+    if maintain_structure:
+        return demo_conversion_structured(max_workers, supported_files)
+    return demo_conversion_flat(max_workers, supported_files)
 
-def show_both_modes():
+def show_both_modes(max_workers=None):
     """Demonstrate both structure modes"""
     print("🚀 PDF Converter Demo - Both Modes")
     print("=" * 60)
     print()
     
     # Demo 1: Maintain directory structure
-    demo_conversion(maintain_structure=True)
+    supported_files = demo_conversion(maintain_structure=True, max_workers=max_workers)
     
     print("\n" + "="*60 + "\n")
     
-    # Demo 2: Flat structure
-    demo_conversion(maintain_structure=False)
+    # Demo 2: Flat structure - reuse the file list instead of scanning again
+    demo_conversion(maintain_structure=False, max_workers=max_workers,
+                    supported_files=supported_files)
     
     print("\n" + "="*60)
     print("🎉 Demo completed! Check the test_files/pdf directory to see the results.")
@@ -157,12 +298,14 @@ if __name__ == "__main__":
     parser.add_argument("--mode", choices=["structured", "flat", "both"], 
                        default="both",
                        help="Conversion mode: 'structured' (maintain dirs), 'flat' (all in one folder), or 'both' (demo both)")
+    parser.add_argument("--max-workers", type=int, default=None,
+                       help="Number of files to convert in parallel (default: CPU count)")
     
     args = parser.parse_args()
     
     if args.mode == "structured":
-        demo_conversion(maintain_structure=True)
+        demo_conversion(maintain_structure=True, max_workers=args.max_workers)
     elif args.mode == "flat":
-        demo_conversion(maintain_structure=False)
+        demo_conversion(maintain_structure=False, max_workers=args.max_workers)
     else:  # both
-        show_both_modes() 
\ No newline at end of file
+        show_both_modes(max_workers=args.max_workers) 
\ No newline at end of file
@@ -5,22 +5,35 @@ Makes folder selection very visible with large status displays and automatic con
 """
 
 import os
-import sys
 import tkinter as tk
 from tkinter import filedialog, messagebox, ttk
 from pathlib import Path
 import threading
+import queue
+import json
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 from datetime import datetime
+from itertools import islice
 
 # Suppress deprecation warning
 os.environ['TK_SILENCE_DEPRECATION'] = '1'
 
-# Import the converter class
-try:
-    from pdf_converter_cli import PDFConverter
-except ImportError:
-    print("Error: Could not import PDFConverter. Make sure pdf_converter_cli.py is in the same directory.")
-    sys.exit(1)
+# Directories that never contain files worth converting. Hidden directories
+# (.git, .venv, ...) are skipped too; set PDFCONV_SCAN_ALL=1 to scan everything
+SKIP_DIRS = frozenset({'node_modules', '__pycache__', 'venv'})
+SCAN_ALL = os.environ.get('PDFCONV_SCAN_ALL') == '1'
+
+# Most recent lines kept in the results box; older ones are dropped so long
+# runs don't make every insert slower
+MAX_LOG_LINES = 2000
+
+# Per-output-folder record of converted sources, used to skip unchanged files
+CONVERSION_CACHE_NAME = ".pdfconv_cache.json"
+
+# The converter module (and the PDF libraries it pulls in) is imported on a
+# background thread by the GUI, so the window can appear straight away
+_pdf_cli = None
 
 
 class ProminentPDFConverterGUI:
@@ -29,17 +42,73 @@ class ProminentPDFConverterGUI:
         self.root.title("PDF Converter Pro")
         self.root.geometry("700x800")
         
-        # Initialize converter
-        self.converter = PDFConverter()
+        # Initialize converter in the background
+        self.converter = None
+        self._converter_ready = threading.Event()
+        threading.Thread(target=self._load_converter, daemon=True).start()
         
         # Variables
         self.selected_directory = ""
         self.conversion_progress = tk.StringVar(value="Ready to convert files")
+        self._progress_var = tk.IntVar(value=0)
         self.maintain_structure = tk.BooleanVar(value=True)
         self.combine_files = tk.BooleanVar(value=False)
+        self.max_workers = tk.IntVar(value=os.cpu_count() or 1)
+        self.io_mode = tk.BooleanVar(value=False)
+        self.link_pdfs = tk.BooleanVar(value=True)
+        
+        # Scan results per directory: (files, file_types, stats)
+        self._file_cache = {}
+        
+        # File type per lowercased extension, filled in as files are scanned
+        self._ext_type_cache = {}
+        
+        # Partial counts and the final result or error posted by preview
+        # worker threads, applied by _drain_preview_queue on the main thread
+        self._preview_queue = queue.Queue()
+        self._scans_running = 0
+        self._scan_thread = None
+        
+        # Log lines queued from any thread, written to the results box in batches
+        self._log_queue = queue.SimpleQueue()
+        
+        # (value, status, maximum) progress snapshots from the conversion
+        # thread; only the latest one is drawn
+        self._progress_queue = queue.SimpleQueue()
+        
+        # Other Tk calls from the conversion thread (message boxes, button
+        # resets), run in order by _poll_ui after the log and progress
+        self._ui_queue = queue.SimpleQueue()
         
         # Create GUI
         self.create_gui()
+        self.convert_button.config(state='disabled', text="⏳ LOADING...", bg="gray")
+        self.root.after(100, self._check_ready)
+        self.root.after(100, self._poll_ui)
+        
+    def _load_converter(self):
+        """Import the converter module and create the converter (worker thread)"""
+        global _pdf_cli
+        try:
+            import pdf_converter_cli
+            _pdf_cli = pdf_converter_cli
+            self.converter = _pdf_cli.PDFConverter()
+        except (ImportError, SystemExit):
+            # pdf_converter_cli exits if its own libraries are missing
+            pass
+        finally:
+            self._converter_ready.set()
+    
+    def _check_ready(self):
+        """Enable the convert button once the converter has loaded"""
+        if not self._converter_ready.is_set():
+            self.root.after(100, self._check_ready)
+        elif self.converter is None:
+            self.convert_button.config(text="❌ CONVERTER UNAVAILABLE", bg="red")
+            messagebox.showerror("Error", "Could not import PDFConverter. Make sure pdf_converter_cli.py "
+                                 "and its requirements are installed.")
+        else:
+            self.convert_button.config(state='normal', text="🔄 CONVERT TO PDF", bg="green")
         
     def create_gui(self):
         """Create GUI with very prominent folder selection display"""
@@ -104,6 +173,9 @@ class ProminentPDFConverterGUI:
                                        wraplength=600)
         self.confirm_details.pack(pady=(0,10))
         
+        # Busy indicator shown while the selected folder is being scanned
+        self.scan_progress = ttk.Progressbar(self.confirm_frame, mode='indeterminate')
+        
         # Structure options
         options_frame = tk.Frame(main_frame)
         options_frame.pack(pady=15)
@@ -111,13 +183,18 @@ class ProminentPDFConverterGUI:
         tk.Label(options_frame, text="Output Structure:", 
                 font=("Arial", 14, "bold")).pack(anchor="w")
         
-        tk.Radiobutton(options_frame, text="Maintain directory structure", 
-                      variable=self.maintain_structure, value=True,
-                      font=("Arial", 11)).pack(anchor="w", pady=2)
+        maintain_radio = tk.Radiobutton(options_frame, text="Maintain directory structure", 
+                                       variable=self.maintain_structure, value=True,
+                                       font=("Arial", 11))
+        maintain_radio.pack(anchor="w", pady=2)
+        
+        flat_radio = tk.Radiobutton(options_frame, text="Flat list (all PDFs in one folder)", 
+                                   variable=self.maintain_structure, value=False,
+                                   font=("Arial", 11))
+        flat_radio.pack(anchor="w", pady=2)
         
-        tk.Radiobutton(options_frame, text="Flat list (all PDFs in one folder)", 
-                      variable=self.maintain_structure, value=False,
-                      font=("Arial", 11)).pack(anchor="w", pady=2)
+        # Kept so the combine toggle can switch them without walking the widget tree
+        self._structure_radiobuttons = [maintain_radio, flat_radio]
         
         # Combine option
         combine_frame = tk.Frame(options_frame)
@@ -133,6 +210,24 @@ class ProminentPDFConverterGUI:
                                    font=("Arial", 9), fg="gray")
         self.combine_info.pack(anchor="w", padx=(20,0))
         
+        # Parallelism options
+        workers_frame = tk.Frame(options_frame)
+        workers_frame.pack(fill=tk.X, pady=(10,0))
+        
+        tk.Label(workers_frame, text="Parallel conversions:", 
+                font=("Arial", 11)).pack(side=tk.LEFT)
+        tk.Spinbox(workers_frame, from_=1, to=max(32, self.max_workers.get()),
+                  textvariable=self.max_workers, width=4,
+                  font=("Arial", 11)).pack(side=tk.LEFT, padx=(5,0))
+        
+        tk.Checkbutton(options_frame, text="🌐 I/O mode (threads, for network drives)", 
+                      variable=self.io_mode,
+                      font=("Arial", 11)).pack(anchor="w", pady=(5,0))
+        
+        tk.Checkbutton(options_frame, text="🔗 Link existing PDFs instead of copying", 
+                      variable=self.link_pdfs,
+                      font=("Arial", 11)).pack(anchor="w", pady=(5,0))
+        
         # Progress
         progress_frame = tk.Frame(main_frame)
         progress_frame.pack(fill=tk.X, pady=15)
@@ -140,7 +235,8 @@ class ProminentPDFConverterGUI:
         tk.Label(progress_frame, text="Conversion Progress:", 
                 font=("Arial", 14, "bold")).pack(anchor="w")
         
-        self.progress_bar = ttk.Progressbar(progress_frame, mode='determinate')
+        self.progress_bar = ttk.Progressbar(progress_frame, mode='determinate',
+                                           variable=self._progress_var)
         self.progress_bar.pack(fill=tk.X, pady=5)
         
         self.progress_label = tk.Label(progress_frame, textvariable=self.conversion_progress,
@@ -179,7 +275,12 @@ class ProminentPDFConverterGUI:
         self.results_text.insert(tk.END, "1. Click 'SELECT FOLDER TO CONVERT'\n")
         self.results_text.insert(tk.END, "2. Choose your output structure\n") 
         self.results_text.insert(tk.END, "3. Click 'CONVERT TO PDF'\n\n")
-        self.results_text.config(state=tk.DISABLED)
+        
+        # Read-only without toggling the widget state on every write: the
+        # text box stays editable for the program but ignores typing and pasting
+        for sequence in ("<Key>", "<<Paste>>", "<<PasteSelection>>", "<<Cut>>"):
+            self.results_text.bind(sequence, lambda e: "break")
+        self.results_text.bind("<Button-1>", lambda e: self.results_text.focus_set())
         
     def browse_directory(self):
         """Browse for directory with very prominent feedback"""
@@ -189,8 +290,8 @@ class ProminentPDFConverterGUI:
         self.browse_btn.config(text="📁 OPENING FOLDER DIALOG...", bg="orange")
         self.root.update_idletasks()
         
-        # Schedule the file dialog
-        self.root.after(100, self._do_browse)
+        # askdirectory runs its own event loop, so the dialog can open directly
+        self._do_browse()
         
     def _do_browse(self):
         """Actually do the browsing with prominent feedback"""
@@ -207,17 +308,17 @@ class ProminentPDFConverterGUI:
                     return
                 
                 self.selected_directory = directory
+                self._file_cache.clear()
                 folder_name = Path(directory).name
                 parent_path = str(Path(directory).parent)
                 
                 print(f"Folder name: {folder_name}")
                 print(f"Parent path: {parent_path}")
                 
-                # Schedule the prominent update
-                self.root.after(10, self._update_display_prominent, directory, folder_name, parent_path)
+                self._update_display_prominent(directory, folder_name, parent_path)
             else:
                 print("No directory selected (user cancelled)")
-                self.root.after(10, self._reset_display)
+                self._reset_display()
                 
         except Exception as e:
             print(f"❌ Error in browse dialog: {e}")
@@ -279,11 +380,11 @@ class ProminentPDFConverterGUI:
             
             print(f"🎯 Display updated successfully: {folder_name}")
             
-            # 7. Show automatic confirmation dialog
-            self.root.after(200, self._show_auto_confirmation, directory, folder_name)
+            # 7. Start the preview scan in the background right away
+            self._post_selection_tasks(directory)
             
-            # 8. Schedule post-selection tasks
-            self.root.after(1000, self._post_selection_tasks, directory)
+            # 8. Show automatic confirmation dialog while the scan runs
+            self._show_auto_confirmation(directory, folder_name)
             
         except Exception as e:
             print(f"❌ Error updating display: {e}")
@@ -291,15 +392,16 @@ class ProminentPDFConverterGUI:
     def _show_auto_confirmation(self, directory, folder_name):
         """Show automatic confirmation dialog"""
         try:
-            # Count files quickly for preview
-            file_count = 0
+            # Count files quickly for preview - stop after 50 so the popup
+            # appears at once even on huge trees
             try:
-                for root, dirs, files in os.walk(directory):
-                    file_count += len([f for f in files if self.converter.get_file_type(Path(root) / f)])
-                    if file_count > 50:  # Stop counting at 50 for speed
-                        file_count = "50+"
-                        break
-            except:
+                cached = self._file_cache.get(directory)
+                if cached is not None:
+                    file_count = len(cached[0])
+                else:
+                    sample = list(islice(self._iter_convertible(directory), 51))
+                    file_count = "50+" if len(sample) > 50 else len(sample)
+            except OSError:
                 file_count = "unknown"
                 
             # Truncate path for display
@@ -334,19 +436,90 @@ class ProminentPDFConverterGUI:
             self.log_message(f"❌ Error scanning directory: {str(e)}")
     
     def preview_files(self, directory):
-        """Preview files to convert"""
+        """Preview files to convert - scans in a background thread so the GUI
+        stays responsive on large directories"""
+        self.scan_progress.pack(fill=tk.X, padx=20, pady=(0,10))
+        self.scan_progress.start(10)
+        self._scans_running += 1
+        if self._scans_running == 1:
+            self.root.after(50, self._drain_preview_queue)
+        
+        thread = threading.Thread(target=self._scan_worker, args=(directory,))
+        thread.daemon = True
+        thread.start()
+        self._scan_thread = thread
+    
+    def _scan_worker(self, directory):
+        """Scan the directory off the Tk main thread and queue the results
+        
+        Tk may only be called from the main thread, so everything goes
+        through _preview_queue for _drain_preview_queue to apply.
+        """
+        def report(count, file_types):
+            self._preview_queue.put(('progress', directory, count, file_types))
+        
+        try:
+            files, file_types, _ = self._scan(directory, progress=report)
+        except Exception as e:
+            self._preview_queue.put(('error', directory, e))
+            return
+        self._preview_queue.put(('done', directory, files, file_types))
+    
+    def _drain_preview_queue(self):
+        """Apply queued scan results (polled on the Tk main thread)
+        
+        Partial counts are coalesced so a fast scan cannot flood Tk's event
+        queue; only the latest one is shown. Polling stops once every
+        running scan has delivered its result or error.
+        """
+        latest = None
+        try:
+            while True:
+                kind, directory, *payload = self._preview_queue.get_nowait()
+                if kind == 'progress':
+                    latest = (directory, *payload)
+                    continue
+                
+                # A count queued before this scan finished is out of date
+                if latest is not None and latest[0] == directory:
+                    latest = None
+                self._scans_running -= 1
+                if kind == 'done':
+                    self._apply_preview_results(directory, *payload)
+                else:
+                    self._apply_preview_error(directory, *payload)
+        except queue.Empty:
+            pass
+        
+        if self._scans_running:
+            if latest is not None:
+                self._update_preview_partial(*latest)
+            self.root.after(50, self._drain_preview_queue)
+    
+    def _update_preview_partial(self, directory, count, file_types):
+        """Update the confirmation panel with the files found so far"""
+        if directory == self.selected_directory:
+            self.confirm_details.config(text=f"🔍 Scanning {Path(directory).name}... {count} files found so far")
+    
+    def _stop_scan_progress(self):
+        """Hide the scan busy indicator"""
+        self.scan_progress.stop()
+        self.scan_progress.pack_forget()
+    
+    def _apply_preview_error(self, directory, error):
+        """Report a failed preview scan (runs on the Tk main thread)"""
+        self._stop_scan_progress()
+        self.log_message(f"❌ Error scanning directory: {str(error)}")
+    
+    def _apply_preview_results(self, directory, files, file_types):
+        """Show the preview scan results (runs on the Tk main thread)"""
+        self._stop_scan_progress()
+        
+        # Ignore results for a folder that is no longer selected
+        if directory != self.selected_directory:
+            return
+        
         try:
-            files = []
-            file_types = {}
-            
-            for root, dirs, file_list in os.walk(directory):
-                for file in file_list:
-                    file_path = Path(root) / file
-                    file_type = self.converter.get_file_type(file_path)
-                    if file_type:
-                        files.append(file_path)
-                        file_types[file_type] = file_types.get(file_type, 0) + 1
-            
             if files:
                 self.log_message(f"🔍 Found {len(files)} convertible files")
                 
@@ -359,13 +532,13 @@ class ProminentPDFConverterGUI:
                     'pdf': '📄'
                 }
                 
-                breakdown_parts = []
-                for file_type, count in file_types.items():
-                    icon = type_icons.get(file_type, '📄')
-                    breakdown_parts.append(f"{icon} {count} {file_type}")
+                breakdown = " • ".join(
+                    f"{type_icons.get(file_type, '📄')} {count} {file_type}"
+                    for file_type, count in file_types.most_common()
+                )
                 
-                if breakdown_parts:
-                    self.log_message(f"📋 File types: {' • '.join(breakdown_parts)}")
+                if breakdown:
+                    self.log_message(f"📋 File types: {breakdown}")
                     
                 # Update the confirmation details with file count
                 self.confirm_details.config(text=f"Ready to convert {len(files)} files from: {Path(directory).name}")
@@ -376,41 +549,154 @@ class ProminentPDFConverterGUI:
         except Exception as e:
             self.log_message(f"❌ Error scanning directory: {str(e)}")
     
+    def _classify(self, name):
+        """Return the file type for a file name, memoized per extension"""
+        ext = os.path.splitext(name)[1].lower()
+        try:
+            return self._ext_type_cache[ext]
+        except KeyError:
+            # A scan can start before the converter has finished loading
+            self._converter_ready.wait()
+            file_type = self._ext_type_cache[ext] = self.converter.get_file_type(name)
+            return file_type
+    
+    def _iter_convertible(self, directory):
+        """Yield (DirEntry, file type) for each convertible file, depth-first
+        
+        Uses os.scandir and the entry types it caches instead of a stat per
+        file, and yields as it goes so callers can stop early. Hidden
+        directories and SKIP_DIRS are not descended into unless SCAN_ALL.
+        Folders that can't be listed are skipped, as os.walk skips them.
+        """
+        stack = [directory]
+        while stack:
+            try:
+                with os.scandir(stack.pop()) as it:
+                    for entry in it:
+                        if entry.is_dir(follow_symlinks=False):
+                            name = entry.name
+                            if SCAN_ALL or not (name.startswith('.') or name in SKIP_DIRS):
+                                stack.append(entry.path)
+                        elif entry.is_file():
+                            file_type = self._classify(entry.name)
+                            if file_type:
+                                yield entry, file_type
+            except OSError:
+                continue
+    
+    def _scan(self, directory, progress=None):
+        """Find all convertible files in a single traversal
+        
+        Results are cached per directory until a new folder is selected.
+        If given, progress(count, file_types) is called every 500 files with
+        a snapshot of the counts so far. File sizes and modification times
+        are read from the directory entries during the same pass so
+        conversion can schedule the largest files first and skip unchanged
+        ones.
+        
+        Returns:
+            tuple: (list of file Paths, Counter of file types,
+                    list of (size, mtime_ns) matching the file list)
+        """
+        cached = self._file_cache.get(directory)
+        if cached is not None:
+            return cached
+        
+        files = []
+        file_types = Counter()
+        stats = []
+        for entry, file_type in self._iter_convertible(directory):
+            files.append(Path(entry.path))
+            # Follows symlinks, like the os.stat recheck in convert_files,
+            # so a linked source is recorded by its target
+            st = entry.stat()
+            stats.append((st.st_size, st.st_mtime_ns))
+            file_types[file_type] += 1
+            if progress and len(files) % 500 == 0:
+                progress(len(files), dict(file_types))
+        
+        self._file_cache[directory] = (files, file_types, stats)
+        return files, file_types, stats
+    
     def log_message(self, message):
-        """Add message to results"""
+        """Add message to results (safe to call from any thread)
+        
+        Messages are queued and written by _flush_log in batches, so a long
+        conversion doesn't redraw the text box once per file.
+        """
+        timestamp = datetime.now().strftime('%H:%M:%S')
+        self._log_queue.put(f"[{timestamp}] {message}\n")
+    
+    def _flush_log(self):
+        """Write all queued messages to the results box in a single insert"""
+        lines = []
+        try:
+            while True:
+                lines.append(self._log_queue.get_nowait())
+        except queue.Empty:
+            pass
+        
+        if not lines:
+            return
+        
         try:
-            self.results_text.config(state=tk.NORMAL)
-            timestamp = datetime.now().strftime('%H:%M:%S')
-            self.results_text.insert(tk.END, f"[{timestamp}] {message}\n")
+            self.results_text.insert(tk.END, "".join(lines))
+            
+            # Every message ends with a newline, so 'end-1c' sits on the empty
+            # line after the last message
+            last_line = int(self.results_text.index('end-1c').split('.')[0])
+            if last_line - 1 > MAX_LOG_LINES:
+                self.results_text.delete('1.0', f'{last_line - MAX_LOG_LINES}.0')
+            
             self.results_text.see(tk.END)
-            self.results_text.config(state=tk.DISABLED)
         except Exception as e:
             print(f"❌ Error logging message: {e}")
     
-    def on_combine_toggle(self):
-        """Handle combine option toggle"""
-        if self.combine_files.get():
-            # Disable structure options when combining
-            for widget in self.root.winfo_children():
-                self._disable_radiobuttons(widget)
-        else:
-            # Re-enable structure options
-            for widget in self.root.winfo_children():
-                self._enable_radiobuttons(widget)
+    def _flush_progress(self):
+        """Draw the most recent queued progress snapshot, dropping older ones"""
+        progress = None
+        try:
+            while True:
+                progress = self._progress_queue.get_nowait()
+        except queue.Empty:
+            pass
+        
+        if progress is not None:
+            self._update_progress(*progress)
+    
+    def _run_ui_calls(self):
+        """Run the Tk calls queued by the conversion thread, in order"""
+        while True:
+            try:
+                func, args = self._ui_queue.get_nowait()
+            except queue.Empty:
+                break
+            try:
+                func(*args)
+            except Exception as e:
+                print(f"❌ Error updating UI: {e}")
     
-    def _disable_radiobuttons(self, widget):
-        """Recursively disable radiobuttons"""
-        if isinstance(widget, tk.Radiobutton):
-            widget.config(state='disabled')
-        for child in widget.winfo_children():
-            self._disable_radiobuttons(child)
+    def _poll_ui(self):
+        """Flush queued log messages, progress and Tk calls every 100 ms on the Tk main thread
+        
+        Queued calls run last, so a message box only opens once the log
+        lines and progress queued before it are on screen.
+        """
+        self._flush_log()
+        self._flush_progress()
+        self._run_ui_calls()
+        self.root.after(100, self._poll_ui)
     
-    def _enable_radiobuttons(self, widget):
-        """Recursively enable radiobuttons"""
-        if isinstance(widget, tk.Radiobutton):
-            widget.config(state='normal')
-        for child in widget.winfo_children():
-            self._enable_radiobuttons(child)
+    def _reset_convert_button(self):
+        """Re-enable the convert button after a conversion"""
+        self.convert_button.config(state='normal', text="🔄 CONVERT TO PDF", bg="green")
+    
+    def on_combine_toggle(self):
+        """Handle combine option toggle"""
+        # Structure options don't apply when combining
+        state = 'disabled' if self.combine_files.get() else 'normal'
+        for radio in self._structure_radiobuttons:
+            radio.config(state=state)
     
     def start_conversion(self):
         """Start conversion"""
@@ -424,21 +710,38 @@ class ProminentPDFConverterGUI:
             messagebox.showerror("Error", "Directory does not exist")
             return
         
-        # Clear results
-        self.results_text.config(state=tk.NORMAL)
+        # Clear results, including anything still queued
+        self._flush_log()
         self.results_text.delete(1.0, tk.END)
-        self.results_text.config(state=tk.DISABLED)
         
         # Update button
         self.convert_button.config(state='disabled', text="🔄 CONVERTING...", bg="orange")
         
+        # Read the options here, since Tk variables belong to the main thread
+        try:
+            max_workers = max(1, self.max_workers.get())
+        except tk.TclError:
+            max_workers = os.cpu_count()
+        options = {
+            'combine': self.combine_files.get(),
+            'maintain_structure': self.maintain_structure.get(),
+            'max_workers': max_workers,
+            'io_mode': self.io_mode.get(),
+            'link_pdfs': self.link_pdfs.get(),
+        }
+        
         # Start conversion thread
-        thread = threading.Thread(target=self.convert_files, args=(directory,))
+        thread = threading.Thread(target=self.convert_files, args=(directory,), kwargs=options)
         thread.daemon = True
         thread.start()
     
-    def convert_files(self, directory):
-        """Convert files"""
+    def convert_files(self, directory, combine=False, maintain_structure=True, max_workers=None,
+                      io_mode=False, link_pdfs=True):
+        """Convert files (runs on the conversion thread)
+        
+        Tk is never called from here: log lines, progress and the remaining
+        Tk calls are queued for _poll_ui to apply on the main thread.
+        """
         try:
             directory_path = Path(directory)
             pdf_output_dir = directory_path / "pdf"
@@ -447,105 +750,228 @@ class ProminentPDFConverterGUI:
             self.log_message(f"Starting conversion...")
             self.log_message(f"Output directory: {pdf_output_dir}")
             
-            # Get files
-            all_files = []
-            for root, dirs, files in os.walk(directory):
-                for file in files:
-                    file_path = Path(root) / file
-                    if self.converter.get_file_type(file_path):
-                        all_files.append(file_path)
+            # Get files (reuses the scan done for the preview) and forget
+            # it, since the conversion writes new files into the tree. If the
+            # preview scan is still running, wait for it rather than walking
+            # the tree a second time.
+            scan_thread = self._scan_thread
+            if scan_thread is not None and scan_thread.is_alive():
+                self.log_message("Waiting for folder scan to finish...")
+                scan_thread.join()
+            all_files, _, stats = self._scan(directory)
+            self._file_cache.pop(directory, None)
             
             if not all_files:
                 self.log_message("No files to convert")
-                self.convert_button.config(state='normal', text="🔄 CONVERT TO PDF", bg="green")
                 return
             
             # Handle combine mode
-            if self.combine_files.get():
+            if combine:
                 self.log_message(f"Combining {len(all_files)} files into single PDF...")
                 
                 output_filename = f"{directory_path.name}_combined.pdf"
                 combined_output_path = pdf_output_dir / output_filename
                 
-                # Import the combine function
-                from pdf_converter_cli import combine_files_to_single_pdf
-                
-                if combine_files_to_single_pdf(all_files, combined_output_path, directory_path):
+                if _pdf_cli.combine_files_to_single_pdf(all_files, combined_output_path, directory_path):
                     self.log_message("✅ Combined PDF created successfully!")
                     self.log_message(f"📁 Combined PDF saved to: {combined_output_path}")
-                    self.conversion_progress.set("Complete: Combined PDF created")
-                    messagebox.showinfo("Conversion Complete", 
-                                      f"Combined PDF created successfully!\n\n"
-                                      f"📄 Combined {len(all_files)} files into single PDF\n"
-                                      f"📁 Saved to: {combined_output_path}")
+                    self._ui_queue.put((self.conversion_progress.set, ("Complete: Combined PDF created",)))
+                    self._ui_queue.put((messagebox.showinfo, ("Conversion Complete",
+                                        f"Combined PDF created successfully!\n\n"
+                                        f"📄 Combined {len(all_files)} files into single PDF\n"
+                                        f"📁 Saved to: {combined_output_path}")))
                 else:
                     self.log_message("❌ Failed to create combined PDF")
-                    messagebox.showerror("Conversion Error", "Failed to create combined PDF")
+                    self._ui_queue.put((messagebox.showerror, ("Conversion Error", "Failed to create combined PDF")))
                 
-                self.convert_button.config(state='normal', text="🔄 CONVERT TO PDF", bg="green")
                 return
             
             self.log_message(f"Converting {len(all_files)} files...")
             
-            # Setup progress
-            self.progress_bar.config(maximum=len(all_files))
+            # Plan every output path up front in this thread so the worker
+            # processes never race on the filesystem or on output names.
+            # Paths are handled as plain strings: the scanned files all start
+            # with the selected directory, so slicing it off is enough.
+            root_len = len(os.path.join(str(directory_path), ''))
+            sources = [str(file_path) for file_path in all_files]
+            relative_sources = [src[root_len:] for src in sources]
+            plan_outputs = self._plan_structured if maintain_structure else self._plan_flat
+            
+            # Sources whose size, mtime and output match the last run are
+            # skipped; new_cache collects what this run leaves in place
+            cache_path = pdf_output_dir / CONVERSION_CACHE_NAME
+            old_cache = self._load_conversion_cache(cache_path)
+            new_cache = {}
+            tasks = []
+            output_len = len(os.path.join(str(pdf_output_dir), ''))
+            
+            for src, relative_src, output_path, (size, mtime_ns) in zip(
+                    sources, relative_sources, plan_outputs(relative_sources, pdf_output_dir), stats):
+                record = [size, mtime_ns, output_path[output_len:]]
+                
+                if old_cache.get(relative_src) == record and os.path.exists(output_path):
+                    # The scan may date from the preview, so confirm the
+                    # source hasn't changed since before trusting it
+                    st = os.stat(src)
+                    if (st.st_size, st.st_mtime_ns) == (size, mtime_ns):
+                        new_cache[relative_src] = record
+                        continue
+                
+                tasks.append((size, src, output_path, relative_src, record))
+            
+            # Submit the largest files first so a big file picked up last
+            # doesn't leave one worker busy long after the others are idle
+            tasks.sort(key=lambda task: task[0], reverse=True)
+            
+            unchanged_count = len(new_cache)
+            if unchanged_count:
+                self.log_message(f"⏭️ Skipping {unchanged_count} unchanged files")
+            
+            # Setup progress; the maximum goes with every snapshot, since
+            # _flush_progress only draws the latest one
+            progress_max = max(len(tasks), 1)
+            self._progress_queue.put((0, "Converting...", progress_max))
             
             success_count = 0
             fail_count = 0
-            
-            for i, file_path in enumerate(all_files):
-                try:
-                    relative_path = file_path.relative_to(directory_path)
-                    pdf_filename = relative_path.stem + ".pdf"
-                    
-                    if self.maintain_structure.get():
-                        output_subdir = pdf_output_dir / relative_path.parent
-                        output_subdir.mkdir(parents=True, exist_ok=True)
-                        output_path = output_subdir / pdf_filename
-                    else:
-                        base_name = relative_path.stem
-                        if relative_path.parent != Path('.'):
-                            parent_name = str(relative_path.parent).replace('/', '_').replace('\\', '_')
-                            base_name = f"{parent_name}_{base_name}"
-                        output_path = pdf_output_dir / f"{base_name}.pdf"
+            done = 0
+            
+            # Conversions are CPU-bound, so they run in worker processes by
+            # default; I/O mode uses threads instead, which is cheaper when
+            # most of the time goes to waiting on a slow network drive
+            executor_class = ThreadPoolExecutor if io_mode else ProcessPoolExecutor
+            
+            # Tk may only be touched from the main thread, so log lines and
+            # progress are queued here and drawn by _poll_ui
+            with executor_class(max_workers=max_workers, initializer=_pdf_cli._init_worker,
+                                initargs=(link_pdfs,)) as executor:
+                futures = {
+                    executor.submit(_pdf_cli._convert_one, src, dst, link_pdfs): (relative_src, record)
+                    for _, src, dst, relative_src, record in tasks
+                }
+                
+                for future in as_completed(futures):
+                    relative_path, record = futures[future]
+                    done += 1
                     
-                    self.conversion_progress.set(f"Converting: {file_path.name}")
+                    try:
+                        _, _, ok = future.result()
+                    except Exception:
+                        ok = False
                     
-                    if self.converter.convert_file(str(file_path), str(output_path)):
+                    if ok:
                         success_count += 1
+                        new_cache[relative_path] = record
                         self.log_message(f"✓ {relative_path}")
                     else:
                         fail_count += 1
                         self.log_message(f"✗ {relative_path}")
                     
-                    self.progress_bar.config(value=i + 1)
-                    self.root.update_idletasks()
-                    
-                except Exception as e:
-                    fail_count += 1
-                    self.log_message(f"✗ Error: {file_path.name}")
+                    self._progress_queue.put((done, f"Converted: {os.path.basename(relative_path)}", progress_max))
+            
+            self._save_conversion_cache(cache_path, new_cache)
             
             # Final summary
             self.log_message("")
             self.log_message("=== CONVERSION COMPLETE ===")
             self.log_message(f"✅ Successfully converted: {success_count}")
+            self.log_message(f"⏭️ Unchanged (skipped): {unchanged_count}")
             self.log_message(f"❌ Failed to convert: {fail_count}")
             self.log_message(f"📁 Output location: {pdf_output_dir}")
             
-            self.conversion_progress.set(f"Complete: {success_count} converted, {fail_count} failed")
+            # Queued behind the last progress update so it isn't overwritten
+            self._progress_queue.put((progress_max,
+                                      f"Complete: {success_count} converted, {unchanged_count} unchanged, {fail_count} failed",
+                                      progress_max))
             
-            messagebox.showinfo("Conversion Complete", 
-                              f"PDF conversion finished!\n\n"
-                              f"✅ Successfully converted: {success_count} files\n"
-                              f"❌ Failed to convert: {fail_count} files\n\n"
-                              f"📁 All PDFs saved to:\n{pdf_output_dir}")
+            self._ui_queue.put((messagebox.showinfo, ("Conversion Complete",
+                                f"PDF conversion finished!\n\n"
+                                f"✅ Successfully converted: {success_count} files\n"
+                                f"⏭️ Unchanged (skipped): {unchanged_count} files\n"
+                                f"❌ Failed to convert: {fail_count} files\n\n"
+                                f"📁 All PDFs saved to:\n{pdf_output_dir}")))
             
         except Exception as e:
             self.log_message(f"❌ Conversion error: {str(e)}")
-            messagebox.showerror("Conversion Error", f"Conversion failed:\n{str(e)}")
+            self._ui_queue.put((messagebox.showerror, ("Conversion Error", f"Conversion failed:\n{str(e)}")))
         
         finally:
-            self.convert_button.config(state='normal', text="🔄 CONVERT TO PDF", bg="green")
+            self._ui_queue.put((self._reset_convert_button, ()))
+    
+    def _plan_structured(self, relative_sources, pdf_output_dir):
+        """Yield an output path for each source, mirroring its folder
+        
+        Each output subdirectory is created once, the first time a file is
+        planned into it. Sources that differ only in extension would share a
+        PDF and race to write it, so repeated names get _1, _2, ... suffixes.
+        """
+        output_dir_str = str(pdf_output_dir)
+        made_dirs = set()
+        planned_outputs = set()
+        
+        for relative_src in relative_sources:
+            parent_rel, file_name = os.path.split(relative_src)
+            output_subdir = os.path.join(output_dir_str, parent_rel)
+            if output_subdir not in made_dirs:
+                os.makedirs(output_subdir, exist_ok=True)
+                made_dirs.add(output_subdir)
+            stem = os.path.splitext(file_name)[0]
+            output_path = os.path.join(output_subdir, stem + ".pdf")
+            counter = 1
+            while output_path in planned_outputs:
+                output_path = os.path.join(output_subdir, f"{stem}_{counter}.pdf")
+                counter += 1
+            planned_outputs.add(output_path)
+            yield output_path
+    
+    def _plan_flat(self, relative_sources, pdf_output_dir):
+        """Yield an output path in the pdf folder for each source
+        
+        Files in subfolders are prefixed with their folder names, and
+        repeated names get _1, _2, ... suffixes.
+        """
+        output_dir_str = str(pdf_output_dir)
+        sep_translate = str.maketrans({'/': '_', '\\': '_'})
+        planned_outputs = set()
+        
+        for relative_src in relative_sources:
+            parent_rel, file_name = os.path.split(relative_src)
+            stem = os.path.splitext(file_name)[0]
+            base_name = f"{parent_rel.translate(sep_translate)}_{stem}" if parent_rel else stem
+            output_path = os.path.join(output_dir_str, base_name + ".pdf")
+            counter = 1
+            while output_path in planned_outputs:
+                output_path = os.path.join(output_dir_str, f"{base_name}_{counter}.pdf")
+                counter += 1
+            planned_outputs.add(output_path)
+            yield output_path
+    
+    def _load_conversion_cache(self, cache_path):
+        """Load the record of previously converted files, or {} if there is none
+        
+        Maps each source path (relative to the selected folder) to
+        [size, mtime_ns, output path relative to the pdf folder].
+        """
+        try:
+            with open(cache_path, encoding='utf-8') as f:
+                cache = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        return cache if isinstance(cache, dict) else {}
+    
+    def _save_conversion_cache(self, cache_path, cache):
+        """Write the record of converted files once, at the end of a run"""
+        try:
+            with open(cache_path, 'w', encoding='utf-8') as f:
+                json.dump(cache, f)
+        except OSError as e:
+            self.log_message(f"⚠️ Could not save conversion cache: {str(e)}")
+    
+    def _update_progress(self, value, status, maximum):
+        """Update progress bar and status text (runs on the Tk main thread)"""
+        self.progress_bar.config(maximum=maximum)
+        self._progress_var.set(value)
+        self.conversion_progress.set(status)
     
     def run(self):
         """Run the app"""
@@ -7,29 +7,59 @@ Converts files in a directory and subdirectories to PDF format
 import os
 import sys
 import argparse
+import shutil
+import tempfile
+import time
 from pathlib import Path
 from datetime import datetime
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from xml.sax.saxutils import escape, quoteattr
 
-# Import conversion libraries
+# Import conversion libraries. python-docx, openpyxl, python-pptx and
+# markdown-it are only imported by the converters that use them, which keeps
+# startup fast when a folder holds none of those files; here they are only
+# checked for, so a missing one is still reported up front.
 try:
+    from importlib.util import find_spec
+    for _module in ('docx', 'openpyxl', 'pptx', 'markdown_it'):
+        if find_spec(_module) is None:
+            raise ImportError(f"No module named '{_module}'")
+    
     from PIL import Image
-    from docx import Document
-    from openpyxl import load_workbook
-    from pptx import Presentation
     from reportlab.pdfgen import canvas
     from reportlab.lib.pagesizes import letter, A4
-    from reportlab.lib.utils import ImageReader
-    from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer
-    from reportlab.lib.styles import getSampleStyleSheet
-    import markdown
+    from reportlab.lib.utils import ImageReader, simpleSplit
+    from reportlab.pdfbase.pdfmetrics import stringWidth
+    from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Flowable, Preformatted
+    from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+    from reportlab import rl_config
 except ImportError as e:
     print(f"Error importing required libraries: {e}")
     print("Please install requirements: pip install -r requirements.txt")
     sys.exit(1)
 
+# Left, right, top and bottom margin for text drawn straight onto a canvas:
+# SimpleDocTemplate's one inch margin plus its frame padding, so text files
+# are laid out where the paragraph-based converters put their text
+TEXT_MARGIN = 72 + 6
+
+# Without --verbose, the CLI progress line is rewritten after this many files
+# or seconds, whichever comes first
+PROGRESS_EVERY = 100
+PROGRESS_INTERVAL = 0.5
+
+# mkstemp creates files readable only by their owner; finished PDFs get the
+# permissions a plain open() would have given them
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+
+# Store PDF streams as binary instead of ASCII85 text, which is 25% larger.
+# Among other things this lets JPEGs be embedded at their original size.
+rl_config.useA85 = 0
+
 
 class PDFConverter:
-    def __init__(self):
+    def __init__(self, link_pdfs=True):
         self.supported_formats = {
             'images': ['.jpg', '.jpeg', '.png', '.gif', '.bmp', '.tiff', '.webp'],
             'documents': ['.docx', '.txt', '.md'],
@@ -38,12 +68,66 @@ class PDFConverter:
             'pdf': ['.pdf']  # For combining/copying existing PDFs
         }
         
+        # Hard link existing PDFs into the output instead of copying them
+        self.link_pdfs = link_pdfs
+        
+        # Category per extension, so lookups don't loop over every category
+        self._ext_to_category = {
+            ext: category
+            for category, extensions in self.supported_formats.items()
+            for ext in extensions
+        }
+        
+        # Converter method per extension, so convert_file is a single lookup
+        self._dispatch = {
+            '.docx': self.convert_docx_to_pdf,
+            '.txt': self.convert_txt_to_pdf,
+            '.md': self.convert_md_to_pdf,
+            '.xlsx': self.convert_xlsx_to_pdf,
+            '.xls': self.convert_xlsx_to_pdf,
+            '.pptx': self.convert_pptx_to_pdf,
+            '.pdf': self.copy_pdf,
+        }
+        for ext in self.supported_formats['images']:
+            self._dispatch[ext] = self.convert_image_to_pdf
+        
+        # Building the sample stylesheet creates dozens of ParagraphStyles,
+        # so do it once rather than for every file
+        self._styles = getSampleStyleSheet()
+        self._normal = self._styles['Normal']
+        
+        # MarkdownIt keeps no state between parse() calls, so one parser is
+        # shared by every file and thread; it's created by the first Markdown
+        # conversion
+        self._md = None
+        
+        # Markdown block styles by (base style name, indent), built on demand
+        self._md_styles = {}
+        
     def convert_image_to_pdf(self, input_path, output_path):
         """Convert image files to PDF"""
         try:
             with Image.open(input_path) as img:
-                # Convert to RGB if necessary
-                if img.mode != 'RGB':
+                # ReportLab embeds JPEG data as-is, so RGB and grayscale JPEGs
+                # skip the decode and lossy re-encode. The page size matches
+                # what PIL produces at 100 dpi.
+                if img.format == 'JPEG' and img.mode in ('RGB', 'L'):
+                    page_width = img.width * 72 / 100.0
+                    page_height = img.height * 72 / 100.0
+                    c = canvas.Canvas(output_path, pagesize=(page_width, page_height))
+                    c.drawImage(input_path, 0, 0, width=page_width, height=page_height)
+                    c.save()
+                    return True
+                
+                # PIL's PDF writer takes RGB, grayscale and CMYK as they are;
+                # transparent images are flattened onto white, anything else
+                # is converted to RGB
+                if img.mode in ('RGBA', 'LA', 'PA') or 'transparency' in img.info:
+                    img = img.convert('RGBA')
+                    background = Image.new('RGB', img.size, 'white')
+                    background.paste(img, mask=img.getchannel('A'))
+                    img = background
+                elif img.mode not in ('RGB', 'L', 'CMYK'):
                     img = img.convert('RGB')
                 img.save(output_path, "PDF", resolution=100.0)
             return True
@@ -54,16 +138,17 @@ class PDFConverter:
     def convert_docx_to_pdf(self, input_path, output_path):
         """Convert DOCX files to PDF"""
         try:
+            from docx import Document
+            
             doc = Document(input_path)
             
             # Create PDF with reportlab
             pdf_doc = SimpleDocTemplate(output_path, pagesize=A4)
-            styles = getSampleStyleSheet()
             story = []
             
             for paragraph in doc.paragraphs:
                 if paragraph.text.strip():
-                    p = Paragraph(paragraph.text, styles['Normal'])
+                    p = Paragraph(paragraph.text, self._normal)
                     story.append(p)
                     story.append(Spacer(1, 12))
             
@@ -84,30 +169,49 @@ class PDFConverter:
     def convert_txt_to_pdf(self, input_path, output_path):
         """Convert text files to PDF"""
         try:
-            with open(input_path, 'r', encoding='utf-8') as file:
-                content = file.read()
-            
-            pdf_doc = SimpleDocTemplate(output_path, pagesize=A4)
-            styles = getSampleStyleSheet()
-            story = []
-            
-            # Split content into lines and create paragraphs
-            lines = content.split('\n')
-            for line in lines:
-                if line.strip():
-                    p = Paragraph(line, styles['Normal'])
-                    story.append(p)
-                else:
-                    story.append(Spacer(1, 12))
-            
-            if story:
-                pdf_doc.build(story)
-            else:
+            if os.path.getsize(input_path) == 0:
                 # Create empty PDF if no content
                 c = canvas.Canvas(output_path, pagesize=A4)
                 c.drawString(100, 750, f"Converted from: {os.path.basename(input_path)}")
                 c.save()
+                return True
             
+            # Lines are wrapped and drawn onto the canvas as they are read,
+            # with the font, leading and margins of the Normal paragraph
+            # layout, so neither the text nor a story of flowables is held
+            # in memory until the end
+            font_name = self._normal.fontName
+            font_size = self._normal.fontSize
+            leading = self._normal.leading
+            width, height = A4
+            margin = TEXT_MARGIN
+            max_width = width - 2 * margin
+            top_y = height - margin - font_size
+            
+            c = canvas.Canvas(output_path, pagesize=A4)
+            text = None
+            y_position = 0
+            
+            with open(input_path, 'r', encoding='utf-8', errors='replace',
+                      buffering=1 << 20) as file:
+                for line in file:
+                    # Blank lines still take up a line of space
+                    pieces = _wrap_text_line(line.rstrip('\n').expandtabs(4),
+                                             font_name, font_size, max_width) or ['']
+                    for piece in pieces:
+                        if text is None or y_position < margin:
+                            if text is not None:
+                                c.drawText(text)
+                                c.showPage()
+                            text = c.beginText(margin, top_y)
+                            text.setFont(font_name, font_size, leading)
+                            y_position = top_y
+                        
+                        text.textLine(piece)
+                        y_position -= leading
+            
+            c.drawText(text)
+            c.save()
             return True
         except Exception as e:
             print(f"Error converting TXT {input_path}: {e}")
@@ -116,57 +220,156 @@ class PDFConverter:
     def convert_md_to_pdf(self, input_path, output_path):
         """Convert Markdown files to PDF"""
         try:
-            with open(input_path, 'r', encoding='utf-8') as file:
-                md_content = file.read()
-            
-            # Convert markdown to HTML then to PDF
-            html_content = markdown.markdown(md_content)
+            if self._md is None:
+                from markdown_it import MarkdownIt
+                self._md = MarkdownIt()
             
-            pdf_doc = SimpleDocTemplate(output_path, pagesize=A4)
-            styles = getSampleStyleSheet()
-            story = []
+            # The parser normalizes line endings itself, so skip text-mode decoding
+            with open(input_path, 'rb') as file:
+                md_content = file.read().decode('utf-8', errors='replace')
             
-            # Simple conversion - just treat as text for now
-            p = Paragraph(html_content, styles['Normal'])
-            story.append(p)
+            # Map the token stream straight to one flowable per block instead
+            # of rendering HTML and wrapping all of it in a single Paragraph
+            story = self._markdown_story(self._md.parse(md_content))
             
-            pdf_doc.build(story)
+            if story:
+                pdf_doc = SimpleDocTemplate(output_path, pagesize=A4)
+                pdf_doc.build(story)
+            else:
+                # Create empty PDF if no content
+                c = canvas.Canvas(output_path, pagesize=A4)
+                c.drawString(100, 750, f"Converted from: {os.path.basename(input_path)}")
+                c.save()
             return True
         except Exception as e:
             print(f"Error converting MD {input_path}: {e}")
             return False
     
+    def _markdown_style(self, name, indent):
+        """Return the named sample style with block spacing and a left indent"""
+        style = self._md_styles.get((name, indent))
+        if style is None:
+            style = ParagraphStyle(
+                f"md{name}{indent}", parent=self._styles[name],
+                spaceAfter=max(self._styles[name].spaceAfter, 6),
+                leftIndent=indent, bulletIndent=max(indent - 12, 0)
+            )
+            self._md_styles[(name, indent)] = style
+        return style
+    
+    def _markdown_story(self, tokens):
+        """Translate markdown-it block tokens into reportlab flowables
+        
+        Headings use the matching HeadingN style, list items get a bullet or
+        number and are indented per nesting level (as are blockquotes), and
+        code blocks are kept verbatim.
+        """
+        story = []
+        lists = []  # None for a bullet list, the last number for an ordered one
+        quotes = 0
+        style_name = 'Normal'
+        bullet = None
+        
+        for token in tokens:
+            kind = token.type
+            indent = 18 * (len(lists) + quotes)
+            
+            if kind == 'heading_open':
+                style_name = f"Heading{token.tag[1]}"
+            elif kind == 'heading_close':
+                style_name = 'Normal'
+            elif kind == 'bullet_list_open':
+                lists.append(None)
+            elif kind == 'ordered_list_open':
+                lists.append(int(token.attrGet('start') or 1) - 1)
+            elif kind in ('bullet_list_close', 'ordered_list_close'):
+                lists.pop()
+            elif kind == 'list_item_open':
+                if lists[-1] is None:
+                    bullet = '•'
+                else:
+                    lists[-1] += 1
+                    bullet = f"{lists[-1]}."
+            elif kind == 'blockquote_open':
+                quotes += 1
+            elif kind == 'blockquote_close':
+                quotes -= 1
+            elif kind == 'inline':
+                story.append(Paragraph(_markdown_inline(token.children),
+                                       self._markdown_style(style_name, indent),
+                                       bulletText=bullet))
+                bullet = None
+            elif kind in ('fence', 'code_block'):
+                story.append(Preformatted(token.content.rstrip('\n'),
+                                          self._markdown_style('Code', indent)))
+            elif kind == 'html_block':
+                story.append(Paragraph(escape(token.content),
+                                       self._markdown_style('Normal', indent)))
+            elif kind == 'hr':
+                story.append(Spacer(1, 12))
+        
+        return story
+    
     def convert_xlsx_to_pdf(self, input_path, output_path):
         """Convert Excel files to PDF"""
         try:
-            workbook = load_workbook(input_path)
-            
-            c = canvas.Canvas(output_path, pagesize=A4)
-            width, height = A4
-            y_position = height - 50
-            
-            c.drawString(50, y_position, f"Excel File: {os.path.basename(input_path)}")
-            y_position -= 30
+            from openpyxl import load_workbook
             
-            for sheet_name in workbook.sheetnames:
-                sheet = workbook[sheet_name]
-                c.drawString(50, y_position, f"Sheet: {sheet_name}")
-                y_position -= 20
+            # Only the first cell values of each sheet are drawn, so stream the
+            # workbook in read-only mode and take cached formula results
+            # rather than building the full cell and style model
+            workbook = load_workbook(input_path, read_only=True, data_only=True, keep_links=False)
+            try:
+                c = canvas.Canvas(output_path, pagesize=A4)
+                width, height = A4
+                y_position = height - 50
+                
+                c.drawString(50, y_position, f"Excel File: {os.path.basename(input_path)}")
+                y_position -= 30
                 
-                for row in sheet.iter_rows(max_row=50, max_col=10, values_only=True):
-                    if y_position < 50:
-                        c.showPage()
-                        y_position = height - 50
+                for sheet_name in workbook.sheetnames:
+                    sheet = workbook[sheet_name]
+                    c.drawString(50, y_position, f"Sheet: {sheet_name}")
+                    y_position -= 20
+                    
+                    # Rows go into one text object per page rather than a
+                    # separate drawString (and text block) per row
+                    text = c.beginText(50, y_position)
+                    text.setLeading(15)
+                    
+                    for row in sheet.iter_rows(max_row=50, max_col=10, values_only=True):
+                        if y_position < 50:
+                            c.drawText(text)
+                            c.showPage()
+                            y_position = height - 50
+                            text = c.beginText(50, y_position)
+                            text.setLeading(15)
+                        
+                        # Only the first 80 characters are drawn, so stop
+                        # formatting cells once the joined text reaches them
+                        parts = []
+                        length = 0
+                        for cell in row:
+                            part = "" if cell is None else str(cell)
+                            parts.append(part)
+                            length += len(part) + 3
+                            if length >= 83:
+                                break
+                        row_text = " | ".join(parts)
+                        
+                        # Cells left out would add " | ", so such a row is never blank
+                        if len(parts) < len(row) or row_text.strip():
+                            text.textLine(row_text[:80])  # Limit text length
+                            y_position -= 15
                     
-                    row_text = " | ".join([str(cell) if cell is not None else "" for cell in row])
-                    if row_text.strip():
-                        c.drawString(50, y_position, row_text[:80])  # Limit text length
-                        y_position -= 15
+                    c.drawText(text)
+                    y_position -= 20
                 
-                y_position -= 20
-            
-            c.save()
-            return True
+                c.save()
+                return True
+            finally:
+                # Read-only workbooks keep the file open until closed
+                workbook.close()
         except Exception as e:
             print(f"Error converting XLSX {input_path}: {e}")
             return False
@@ -174,29 +377,44 @@ class PDFConverter:
     def convert_pptx_to_pdf(self, input_path, output_path):
         """Convert PowerPoint files to PDF"""
         try:
+            from pptx import Presentation
+            
             presentation = Presentation(input_path)
             
             c = canvas.Canvas(output_path, pagesize=A4)
             width, height = A4
+            top_y = height - 50
+            first_line_y = height - 80
             
-            c.drawString(50, height - 50, f"PowerPoint: {os.path.basename(input_path)}")
+            c.drawString(50, top_y, f"PowerPoint: {os.path.basename(input_path)}")
             
             slide_num = 1
             for slide in presentation.slides:
                 c.showPage()
-                c.drawString(50, height - 50, f"Slide {slide_num}")
-                y_position = height - 80
+                c.drawString(50, top_y, f"Slide {slide_num}")
+                y_position = first_line_y
+                
+                # Lines go into one text object per page, as for spreadsheets
+                text_obj = c.beginText(50, y_position)
+                text_obj.setLeading(20)
                 
                 for shape in slide.shapes:
-                    if hasattr(shape, "text") and shape.text:
-                        text_lines = shape.text.split('\n')
+                    # shape.text is rebuilt from the XML on every access, so
+                    # read it once; shapes without text don't have it at all
+                    text = getattr(shape, "text", None)
+                    if text:
+                        text_lines = text.split('\n')
                         for line in text_lines:
                             if y_position < 50:
+                                c.drawText(text_obj)
                                 c.showPage()
-                                y_position = height - 50
-                            c.drawString(50, y_position, line[:80])
+                                y_position = top_y
+                                text_obj = c.beginText(50, y_position)
+                                text_obj.setLeading(20)
+                            text_obj.textLine(line[:80])
                             y_position -= 20
                 
+                c.drawText(text_obj)
                 slide_num += 1
             
             c.save()
@@ -205,98 +423,301 @@ class PDFConverter:
             print(f"Error converting PPTX {input_path}: {e}")
             return False
     
+    def copy_pdf(self, input_path, output_path):
+        """Copy an existing PDF, as a hard link if link_pdfs is set
+        
+        A hard link costs no time or disk space. It falls back to a real copy
+        across filesystems or where links aren't supported.
+        """
+        # Replace any earlier output, which may be a link to this same file
+        if os.path.lexists(output_path):
+            os.remove(output_path)
+        
+        if self.link_pdfs:
+            try:
+                os.link(input_path, output_path)
+                return True
+            except OSError:
+                pass
+        
+        shutil.copy2(input_path, output_path)
+        return True
+    
     def get_file_type(self, file_path):
         """Determine the file type category"""
-        extension = Path(file_path).suffix.lower()
-        
-        for category, extensions in self.supported_formats.items():
-            if extension in extensions:
-                return category
-        return None
+        return self._ext_to_category.get(os.path.splitext(file_path)[1].lower())
     
     def convert_file(self, input_path, output_path):
-        """Convert a single file to PDF"""
-        file_type = self.get_file_type(input_path)
+        """Convert a single file to PDF
         
-        if not file_type:
+        The PDF is written next to output_path under a unique temporary name
+        and renamed into place once complete, so an interrupted or failed
+        conversion never leaves a truncated PDF (or clobbers the one from
+        an earlier run), and concurrent conversions never share a temp file.
+        """
+        convert = self._dispatch.get(os.path.splitext(input_path)[1].lower())
+        
+        if not convert:
             return False
         
+        tmp_path = None
         try:
-            if file_type == 'images':
-                return self.convert_image_to_pdf(input_path, output_path)
-            elif file_type == 'documents':
-                ext = Path(input_path).suffix.lower()
-                if ext == '.docx':
-                    return self.convert_docx_to_pdf(input_path, output_path)
-                elif ext == '.txt':
-                    return self.convert_txt_to_pdf(input_path, output_path)
-                elif ext == '.md':
-                    return self.convert_md_to_pdf(input_path, output_path)
-            elif file_type == 'spreadsheets':
-                return self.convert_xlsx_to_pdf(input_path, output_path)
-            elif file_type == 'presentations':
-                return self.convert_pptx_to_pdf(input_path, output_path)
-            elif file_type == 'pdf':
-                # Copy existing PDF
-                import shutil
-                shutil.copy2(input_path, output_path)
-                return True
+            fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(output_path) or '.', suffix='.tmp')
+            os.close(fd)
+            os.chmod(tmp_path, 0o666 & ~_UMASK)
             
-            return False
+            ok = convert(input_path, tmp_path)
+            if ok:
+                os.replace(tmp_path, output_path)
+            return ok
         except Exception as e:
             print(f"Error converting {input_path}: {e}")
             return False
+        finally:
+            if tmp_path and os.path.lexists(tmp_path):
+                os.remove(tmp_path)
+
+
+def _wrap_text_line(line, font_name, font_size, max_width):
+    """Split a line of plain text into pieces no wider than max_width
+    
+    Words wrap as in a Paragraph; a single word wider than the line is
+    broken across lines. Returns an empty list for a blank line.
+    """
+    pieces = []
+    for piece in simpleSplit(line, font_name, font_size, max_width):
+        piece_width = stringWidth(piece, font_name, font_size)
+        while piece_width > max_width:
+            cut = max(1, int(len(piece) * max_width / piece_width))
+            while cut > 1 and stringWidth(piece[:cut], font_name, font_size) > max_width:
+                cut -= 1
+            pieces.append(piece[:cut])
+            piece = piece[cut:]
+            piece_width = stringWidth(piece, font_name, font_size)
+        pieces.append(piece)
+    return pieces
+
+
+# Paragraph markup for markdown-it inline tokens that map to a fixed tag
+_MARKDOWN_INLINE_TAGS = {
+    'strong_open': '<b>', 'strong_close': '</b>',
+    'em_open': '<i>', 'em_close': '</i>',
+    's_open': '<strike>', 's_close': '</strike>',
+    'link_close': '</link>',
+    'softbreak': ' ', 'hardbreak': '<br/>',
+}
+
+
+def _markdown_inline(children):
+    """Build reportlab Paragraph markup from markdown-it inline tokens"""
+    parts = []
+    for child in children or ():
+        kind = child.type
+        if kind in _MARKDOWN_INLINE_TAGS:
+            parts.append(_MARKDOWN_INLINE_TAGS[kind])
+        elif kind == 'code_inline':
+            parts.append(f'<font face="Courier">{escape(child.content)}</font>')
+        elif kind == 'link_open':
+            parts.append(f"<link href={quoteattr(child.attrGet('href') or '')}>")
+        else:
+            # Plain text, inline HTML shown as written and image alt text
+            parts.append(escape(child.content))
+    return ''.join(parts)
+
+
+# Converter used by _convert_one inside pool worker processes
+_worker_converter = None
 
 
-def generate_unique_filename(output_dir, base_name, extension=".pdf"):
-    """Generate a unique filename to avoid conflicts in flat structure mode"""
-    output_path = output_dir / f"{base_name}{extension}"
+def _init_worker(link_pdfs=True):
+    """Pool initializer: build the worker's PDFConverter before any task runs
+    
+    The stylesheet and dispatch table are then set up while the pool starts
+    rather than inside the first conversion each worker picks up.
+    """
+    global _worker_converter
+    _worker_converter = PDFConverter(link_pdfs=link_pdfs)
+
+
+def _convert_one(input_path, output_path, link_pdfs=True):
+    """Convert a single file inside a pool worker process
+    
+    Each worker builds its own PDFConverter once and reuses it, so only the
+    path strings have to be pickled. Returns (input_path, output_path, ok).
+    """
+    global _worker_converter
+    if _worker_converter is None:
+        _worker_converter = PDFConverter()
+    _worker_converter.link_pdfs = link_pdfs
+    return input_path, output_path, _worker_converter.convert_file(input_path, output_path)
+
+
+def generate_unique_filename(output_dir, base_name, allocated_names, extension=".pdf"):
+    """Generate a unique filename to avoid conflicts in flat structure mode
+    
+    allocated_names holds the lowercased names already present in or handed
+    out for output_dir, so candidates are checked in memory instead of with a
+    stat each. Comparing lowercased names keeps case-insensitive filesystems
+    (the macOS default) from overwriting one output with another.
+    """
+    name = f"{base_name}{extension}"
     counter = 1
     
-    while output_path.exists():
-        output_path = output_dir / f"{base_name}_{counter}{extension}"
+    while name.lower() in allocated_names:
+        name = f"{base_name}_{counter}{extension}"
         counter += 1
     
-    return output_path
+    allocated_names.add(name.lower())
+    return os.path.join(output_dir, name)
+
+
+def _iter_supported_files(directory, ext_to_category):
+    """Yield the path string of every supported file under directory
+    
+    Walks with os.scandir in the same top-down order as os.walk, but reuses
+    the entry types from the directory listing and tests each name against
+    the supported suffixes with a single str.endswith, without building any
+    Path objects. Symlinked directories are listed but not followed, and
+    unreadable directories are skipped, as with os.walk.
+    """
+    suffixes = tuple(ext_to_category)
+    stack = [os.fspath(directory)]
+    while stack:
+        subdirs = []
+        try:
+            with os.scandir(stack.pop()) as it:
+                for entry in it:
+                    try:
+                        is_dir = entry.is_dir()
+                    except OSError:
+                        is_dir = False
+                    
+                    if is_dir:
+                        if not entry.is_symlink():
+                            subdirs.append(entry.path)
+                    else:
+                        name = entry.name.lower()
+                        # A name that is only a suffix (".txt") is a hidden
+                        # file without an extension, as splitext sees it
+                        if name.endswith(suffixes) and name not in ext_to_category:
+                            yield entry.path
+        except OSError:
+            continue
+        
+        # Reversed so the first subdirectory is walked first
+        stack.extend(reversed(subdirs))
+
+
+class _PageMarker(Flowable):
+    """Zero-size flowable that records the page it lands on
+    
+    Combine mode places one after the title of each existing PDF, so the
+    PDF's own pages can be spliced in after that page once the story is
+    built.
+    """
+    
+    def __init__(self, file_path):
+        Flowable.__init__(self)
+        self.file_path = file_path
+        self.page = None
+    
+    def wrap(self, availWidth, availHeight):
+        return 0, 0
+    
+    def draw(self):
+        self.page = self.canv.getPageNumber()
+
+
+def _splice_pdfs(output_path, markers):
+    """Insert the pages of existing PDFs into the combined PDF
+    
+    Each embedded PDF's pages go right after the page holding its marker.
+    PDFs that cannot be read are reported and left out.
+    """
+    from PyPDF2 import PdfReader, PdfWriter
+    
+    # Source pages by the combined page they follow
+    inserts = {}
+    for marker in markers:
+        inserts.setdefault(marker.page, []).append(marker.file_path)
+    
+    combined = PdfReader(str(output_path))
+    writer = PdfWriter()
+    
+    for page_number, page in enumerate(combined.pages, 1):
+        writer.add_page(page)
+        
+        for file_path in inserts.get(page_number, ()):
+            try:
+                reader = PdfReader(str(file_path))
+                if reader.is_encrypted:
+                    reader.decrypt('')
+                for source_page in reader.pages:
+                    writer.add_page(source_page)
+            except Exception as e:
+                print(f"⚠️  Could not embed {file_path.name}: {e}")
+    
+    # Write next to the output and swap it in, so a failure part way
+    # leaves the reportlab-only PDF in place
+    tmp_path = f"{output_path}.tmp"
+    with open(tmp_path, 'wb') as f:
+        writer.write(f)
+    os.replace(tmp_path, output_path)
 
 
 def combine_files_to_single_pdf(files, output_path, directory_path):
     """Combine all files into a single PDF with file titles"""
     try:
-        from reportlab.lib.styles import getSampleStyleSheet
         from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, PageBreak
         from reportlab.lib.units import inch
         from reportlab.lib.pagesizes import A4
         from reportlab.pdfgen import canvas
         from PIL import Image
-        import io
+        import tempfile
+        
+        # Resized images are spooled to this directory and read back by
+        # reportlab one at a time while building, instead of holding every
+        # image in memory until the end
+        tmp_dir = tempfile.TemporaryDirectory(prefix="pdfconv_combine_")
         
         # Create PDF document
         doc = SimpleDocTemplate(str(output_path), pagesize=A4)
-        styles = getSampleStyleSheet()
         story = []
         
-        # Title style
-        title_style = styles['Heading1']
-        title_style.fontSize = 16
-        title_style.spaceAfter = 12
+        # The converter's stylesheet is reused; combine mode derives its own
+        # styles from it rather than building another sheet and mutating it
+        converter = PDFConverter()
+        styles = converter._styles
         
-        # Subtitle style for file names
-        subtitle_style = styles['Heading2']
-        subtitle_style.fontSize = 14
-        subtitle_style.spaceAfter = 8
+        # Title style
+        title_style = ParagraphStyle('CombineTitle', parent=styles['Heading1'],
+                                     fontSize=16, spaceAfter=12)
         
         # Normal style
-        normal_style = styles['Normal']
-        normal_style.fontSize = 10
-        normal_style.spaceAfter = 6
+        normal_style = ParagraphStyle('CombineNormal', parent=styles['Normal'],
+                                      fontSize=10, spaceAfter=6)
         
         print(f"📄 Creating combined PDF: {output_path.name}")
         
+        # Category per extension, looked up directly for each file
+        ext_to_category = converter._ext_to_category
+        
+        # Markers for existing PDFs whose pages get spliced in after the build
+        pdf_markers = []
+        
+        def add_text_line(line):
+            """Add one line of document text, or a small gap for a blank line"""
+            if line.strip():
+                # Escape HTML special characters
+                story.append(Paragraph(escape(line), normal_style))
+            else:
+                story.append(Spacer(1, 6))
+        
         for i, file_path in enumerate(files, 1):
             try:
                 relative_path = file_path.relative_to(directory_path)
-                file_type = PDFConverter().get_file_type(file_path)
+                suffix = file_path.suffix.lower()
+                file_type = ext_to_category.get(suffix)
                 
                 print(f"[{i:3d}/{len(files)}] Adding: {relative_path}")
                 
@@ -312,24 +733,27 @@ def combine_files_to_single_pdf(files, output_path, directory_path):
                     # Try to add the actual image
                     try:
                         with Image.open(file_path) as img:
+                            # Resize image to fit page width
+                            target = (int(A4[0] - 2*inch), int(A4[1] - 2*inch))
+                            
+                            # Let the JPEG decoder scale down by 1/2, 1/4 or 1/8
+                            # while decoding, so large photos are never fully
+                            # decoded just to be shrunk (no-op for other formats)
+                            img.draft('RGB', target)
+                            
                             # Convert to RGB if necessary
                             if img.mode != 'RGB':
                                 img = img.convert('RGB')
                             
-                            # Resize image to fit page width
-                            max_width = A4[0] - 2*inch
-                            max_height = A4[1] - 2*inch
+                            img.thumbnail(target, Image.Resampling.LANCZOS)
                             
-                            img.thumbnail((max_width, max_height), Image.Resampling.LANCZOS)
+                            # Save to a temporary file
+                            img_file = os.path.join(tmp_dir.name, f"{i}.jpg")
+                            img.save(img_file, format='JPEG', quality=85)
                             
-                            # Save to bytes
-                            img_bytes = io.BytesIO()
-                            img.save(img_bytes, format='JPEG', quality=85)
-                            img_bytes.seek(0)
-                            
-                            # Add image to PDF
+                            # Add image to PDF (lazy=2 opens and closes it while drawing)
                             from reportlab.platypus import Image as RLImage
-                            story.append(RLImage(img_bytes, width=img.width, height=img.height))
+                            story.append(RLImage(img_file, width=img.width, height=img.height, lazy=2))
                             story.append(Spacer(1, 12))
                     except Exception as e:
                         story.append(Paragraph(f"<i>Could not embed image: {str(e)}</i>", normal_style))
@@ -337,28 +761,23 @@ def combine_files_to_single_pdf(files, output_path, directory_path):
                 elif file_type == 'documents':
                     # For text documents, add the content
                     try:
-                        if file_path.suffix.lower() == '.txt':
-                            with open(file_path, 'r', encoding='utf-8') as f:
-                                content = f.read()
-                        elif file_path.suffix.lower() == '.md':
-                            with open(file_path, 'r', encoding='utf-8') as f:
-                                content = f.read()
-                        elif file_path.suffix.lower() == '.docx':
-                            from docx import Document
-                            doc_doc = Document(file_path)
-                            content = '\n'.join([paragraph.text for paragraph in doc_doc.paragraphs])
+                        if suffix in ('.txt', '.md'):
+                            # Add text files line by line as they are read
+                            with open(file_path, 'r', encoding='utf-8', errors='replace',
+                                      buffering=1 << 20) as f:
+                                for line in f:
+                                    add_text_line(line.rstrip('\n'))
                         else:
-                            content = f"Document file: {file_path.name}"
-                        
-                        # Split content into paragraphs and add to PDF
-                        lines = content.split('\n')
-                        for line in lines:
-                            if line.strip():
-                                # Escape HTML special characters
-                                escaped_line = line.replace('&', '&amp;').replace('<', '&lt;').replace('>', '&gt;')
-                                story.append(Paragraph(escaped_line, normal_style))
+                            if suffix == '.docx':
+                                from docx import Document
+                                doc_doc = Document(file_path)
+                                content = '\n'.join([paragraph.text for paragraph in doc_doc.paragraphs])
                             else:
-                                story.append(Spacer(1, 6))
+                                content = f"Document file: {file_path.name}"
+                            
+                            # Split content into paragraphs and add to PDF
+                            for line in content.split('\n'):
+                                add_text_line(line)
                                 
                     except Exception as e:
                         story.append(Paragraph(f"<i>Could not read document: {str(e)}</i>", normal_style))
@@ -379,7 +798,12 @@ def combine_files_to_single_pdf(files, output_path, directory_path):
                     # For existing PDFs, add basic info
                     story.append(Paragraph(f"<i>Existing PDF file: {file_path.name}</i>", normal_style))
                     story.append(Paragraph(f"<i>Size: {file_path.stat().st_size} bytes</i>", normal_style))
-                    story.append(Paragraph(f"<i>Note: PDF content not embedded in combined PDF</i>", normal_style))
+                    
+                    # Its pages follow the page this marker lands on
+                    marker = _PageMarker(file_path)
+                    pdf_markers.append(marker)
+                    story.append(marker)
+                    story.append(PageBreak())
                 
                 # Add separator between files
                 story.append(Spacer(1, 12))
@@ -395,7 +819,11 @@ def combine_files_to_single_pdf(files, output_path, directory_path):
                 story.append(Spacer(1, 12))
         
         # Build the PDF
-        doc.build(story)
+        with tmp_dir:
+            doc.build(story)
+        
+        if pdf_markers:
+            _splice_pdfs(output_path, pdf_markers)
         return True
         
     except Exception as e:
@@ -403,9 +831,10 @@ def combine_files_to_single_pdf(files, output_path, directory_path):
         return False
 
 
-def convert_directory(directory, maintain_structure=True, output_dir=None, verbose=False, combine=False):
+def convert_directory(directory, maintain_structure=True, output_dir=None, verbose=False, combine=False,
+                      link_pdfs=True):
     """Convert all files in directory and subdirectories"""
-    converter = PDFConverter()
+    converter = PDFConverter(link_pdfs=link_pdfs)
     
     directory_path = Path(directory).resolve()
     
@@ -437,12 +866,10 @@ def convert_directory(directory, maintain_structure=True, output_dir=None, verbo
     print()
     
     # Get all files to convert
-    all_files = []
-    for root, dirs, files in os.walk(directory_path):
-        for file in files:
-            file_path = Path(root) / file
-            if converter.get_file_type(file_path):
-                all_files.append(file_path)
+    all_files = list(_iter_supported_files(directory_path, converter._ext_to_category))
+    
+    # Length of the source directory prefix, to slice relative paths off
+    root_len = len(os.path.join(str(directory_path), ''))
     
     if not all_files:
         print("❌ No supported files found in the directory")
@@ -457,8 +884,7 @@ def convert_directory(directory, maintain_structure=True, output_dir=None, verbo
     print(f"📋 Found {len(all_files)} files to convert:")
     if verbose:
         for file_path in all_files:
-            relative_path = file_path.relative_to(directory_path)
-            print(f"   • {relative_path}")
+            print(f"   • {file_path[root_len:]}")
     else:
         print(f"   Use --verbose to see file list")
     print()
@@ -472,7 +898,7 @@ def convert_directory(directory, maintain_structure=True, output_dir=None, verbo
         print(f"📄 Output file: {combined_output_path}")
         print()
         
-        if combine_files_to_single_pdf(all_files, combined_output_path, directory_path):
+        if combine_files_to_single_pdf([Path(p) for p in all_files], combined_output_path, directory_path):
             print("✅ Combined PDF created successfully!")
             print(f"📁 Combined PDF saved to: {combined_output_path}")
             return True
@@ -483,45 +909,111 @@ def convert_directory(directory, maintain_structure=True, output_dir=None, verbo
     successful_conversions = 0
     failed_conversions = 0
     
-    for i, file_path in enumerate(all_files, 1):
+    # Names taken in the flat output folder, read once up front
+    if not maintain_structure:
+        allocated_names = {name.lower() for name in os.listdir(pdf_output_dir)}
+    
+    # Structured outputs handed out so far, per output folder. Sources that
+    # differ only in extension (report.txt, report.md) would otherwise share
+    # one PDF and race to write it, so later ones get a _N suffix.
+    planned_names = {}
+    
+    # Plan every output path here in the parent, so output directories and
+    # unique flat names are settled before any worker starts writing.
+    # Paths stay plain strings, sliced and split rather than wrapped in Path.
+    pdf_output_str = str(pdf_output_dir)
+    made_dirs = set()
+    tasks = {}
+    for file_path in all_files:
         try:
             # Create relative path structure in PDF directory
-            relative_path = file_path.relative_to(directory_path)
-            pdf_filename = relative_path.stem + ".pdf"
+            relative_path = file_path[root_len:]
+            parent_rel, file_name = os.path.split(relative_path)
+            stem = os.path.splitext(file_name)[0]
             
             if maintain_structure:
                 # Maintain directory structure
-                output_subdir = pdf_output_dir / relative_path.parent
-                output_subdir.mkdir(parents=True, exist_ok=True)
-                output_path = output_subdir / pdf_filename
+                output_subdir = os.path.join(pdf_output_str, parent_rel) if parent_rel else pdf_output_str
+                if output_subdir not in made_dirs:
+                    os.makedirs(output_subdir, exist_ok=True)
+                    made_dirs.add(output_subdir)
+                output_path = generate_unique_filename(output_subdir, stem,
+                                                       planned_names.setdefault(output_subdir, set()))
+                output_label = os.path.join(parent_rel, os.path.basename(output_path))
             else:
                 # Flat structure - all files in root pdf directory
-                base_name = relative_path.stem
+                base_name = stem
                 # If file is in subdirectory, include parent directory name to make it unique
-                if relative_path.parent != Path('.'):
-                    parent_name = str(relative_path.parent).replace('/', '_').replace('\\', '_')
+                if parent_rel:
+                    parent_name = parent_rel.replace('/', '_').replace('\\', '_')
                     base_name = f"{parent_name}_{base_name}"
                 
-                output_path = generate_unique_filename(pdf_output_dir, base_name)
+                output_path = generate_unique_filename(pdf_output_str, base_name, allocated_names)
+                output_label = os.path.basename(output_path)
+            
+            tasks[file_path] = (relative_path, output_path, output_label)
             
-            print(f"[{i:3d}/{len(all_files)}] Converting: {relative_path}", end=" ")
+        except Exception as e:
+            failed_conversions += 1
+            print(f"❌ Error: {file_path}: {str(e)}")
+    
+    # Conversions are CPU bound and write independent files, so run them in
+    # worker processes and report each one as it completes
+    total = len(all_files)
+    done = failed_conversions
+    
+    # Without --verbose only failures get a line of their own; progress is a
+    # single status line, redrawn in place on a terminal, written at most
+    # every PROGRESS_EVERY files or PROGRESS_INTERVAL seconds
+    on_tty = sys.stdout.isatty()
+    status_shown = False
+    last_status = 0.0
+    
+    with ProcessPoolExecutor(max_workers=os.cpu_count(), initializer=_init_worker,
+                             initargs=(link_pdfs,)) as executor:
+        futures = {
+            executor.submit(_convert_one, input_path, output_path, link_pdfs): input_path
+            for input_path, (relative_path, output_path, output_label) in tasks.items()
+        }
+        
+        for future in as_completed(futures):
+            done += 1
+            relative_path, output_path, output_label = tasks[futures[future]]
             
-            # Convert file
-            if converter.convert_file(str(file_path), str(output_path)):
+            try:
+                ok = future.result()[2]
+                error = None
+            except Exception as e:
+                ok = False
+                error = str(e)
+            
+            if ok:
                 successful_conversions += 1
-                if maintain_structure:
-                    print(f"✅")
-                    if verbose:
-                        print(f"           → {output_path.relative_to(pdf_output_dir)}")
-                else:
-                    print(f"✅ → {output_path.name}")
+                if verbose:
+                    print(f"[{done:3d}/{total}] Converted: {relative_path} ✅\n           → {output_label}")
             else:
                 failed_conversions += 1
-                print(f"❌")
-                
-        except Exception as e:
-            failed_conversions += 1
-            print(f"❌ Error: {str(e)}")
+                result = f"[{done:3d}/{total}] Failed: {relative_path} ❌"
+                if error:
+                    result += f" Error: {error}"
+                # Clear the status line first so the failure doesn't run into it
+                print(f"\r\033[K{result}" if status_shown else result)
+                status_shown = False
+            
+            if not verbose:
+                now = time.monotonic()
+                if done == total or done % PROGRESS_EVERY == 0 or now - last_status >= PROGRESS_INTERVAL:
+                    last_status = now
+                    status = f"[{done:3d}/{total}] ✅ {successful_conversions} ❌ {failed_conversions}"
+                    if on_tty:
+                        sys.stdout.write(f"\r{status}")
+                        sys.stdout.flush()
+                        status_shown = True
+                    else:
+                        print(status)
+    
+    if status_shown:
+        print()
     
     # Final summary
     print()
@@ -558,7 +1050,7 @@ Supported file formats:
   • Documents: DOCX, TXT, Markdown
   • Spreadsheets: XLSX, XLS  
   • Presentations: PPTX
-  • PDFs: Existing PDFs will be copied
+  • PDFs: Existing PDFs will be hard linked (or copied, see --copy-pdfs)
         """
     )
     
@@ -590,6 +1082,12 @@ Supported file formats:
         help="Combine all files into a single PDF with file titles"
     )
     
+    parser.add_argument(
+        "--copy-pdfs",
+        action="store_true",
+        help="Always copy existing PDFs instead of hard linking them when possible"
+    )
+    
     parser.add_argument(
         "--version",
         action="version",
@@ -604,7 +1102,8 @@ Supported file formats:
             maintain_structure=not args.flat,
             output_dir=args.output,
             verbose=args.verbose,
-            combine=args.combine
+            combine=args.combine,
+            link_pdfs=not args.copy_pdfs
         )
         
         sys.exit(0 if success else 1)
@@ -14,7 +14,7 @@ cd "$SCRIPT_DIR"
 
 # Check if Python 3 is available
 if ! command -v python3 &> /dev/null; then
-    echo "❌ Python 3 is not installed. Please install Python 3.7 or higher."
+    echo "❌ Python 3 is not installed. Please install Python 3.8 or higher."
     exit 1
 fi
 
@@ -10,13 +10,13 @@ export TK_SILENCE_DEPRECATION=1
 
 # Check if Python 3 is available
 if ! command -v python3 &> /dev/null; then
-    echo "❌ Python 3 is not installed. Please install Python 3.7 or higher."
+    echo "❌ Python 3 is not installed. Please install Python 3.8 or higher."
     exit 1
 fi
 
 # Check Python version
 PYTHON_VERSION=$(python3 -c 'import sys; print(".".join(map(str, sys.version_info[:2])))')
-REQUIRED_VERSION="3.7"
+REQUIRED_VERSION="3.8"
 
 if [ "$(printf '%s\n' "$REQUIRED_VERSION" "$PYTHON_VERSION" | sort -V | head -n1)" != "$REQUIRED_VERSION" ]; then
     echo "❌ Python version $PYTHON_VERSION found, but $REQUIRED_VERSION or higher is required."
@@ -33,7 +33,7 @@ cd "$SCRIPT_DIR"
 echo "📦 Checking dependencies..."
 python3 -c "
 try:
-    import PIL, docx, openpyxl, pptx, reportlab, PyPDF2, markdown
+    import PIL, docx, openpyxl, pptx, reportlab, PyPDF2, markdown_it
     print('✓ All dependencies are installed')
 except ImportError as e:
     print(f'❌ Missing dependency: {e}')
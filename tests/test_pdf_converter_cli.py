@@ -0,0 +1,28 @@
+#!/usr/bin/env python3
+"""
+Tests for the command line PDF converter
+"""
+
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from PyPDF2 import PdfReader
+from pdf_converter_cli import PDFConverter
+
+
+@pytest.mark.parametrize("content", ["", "  \n\n\t\n"])
+def test_empty_markdown_gives_one_page(tmp_path, content):
+    """An empty or whitespace-only .md file still produces a one page PDF"""
+    input_path = tmp_path / "empty.md"
+    input_path.write_text(content)
+    output_path = tmp_path / "empty.pdf"
+    
+    assert PDFConverter().convert_file(str(input_path), str(output_path))
+    
+    reader = PdfReader(str(output_path))
+    assert len(reader.pages) == 1
+    assert "Converted from: empty.md" in reader.pages[0].extract_text()